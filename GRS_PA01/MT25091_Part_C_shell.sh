@@ -161,5 +161,5 @@ python3 MT25091_Part_D_Plot.py
 if [ $? -eq 0 ]; then
     echo "Plots generated successfully."
 else
-    echo "Plot generation failed. Ensure python3 and matplotlib are installed."
+    echo "Plot generation failed. Ensure python3, matplotlib and pandas are installed."
 fi
@@ -1,18 +1,40 @@
-import csv
+import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 import sys
 import os
 
+def load_csv(csv_file):
+    """
+    Loads a results CSV, reusing a Feather copy when it is newer than the CSV
+    """
+    cache = csv_file + '.feather'
+    if os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(csv_file):
+        try:
+            return pd.read_feather(cache)
+        except Exception:
+            pass # No pyarrow or unreadable cache, fall back to the CSV
+
+    df = pd.read_csv(csv_file, skipinitialspace=True, engine='c')
+    # Write to a temp file first so a half-written cache never looks fresh
+    tmp = cache + '.tmp'
+    try:
+        df.to_feather(tmp)
+        os.replace(tmp, cache)
+    except Exception:
+        # Caching is optional; just drop any partial temp file
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+    return df
+
 def plot_part_c(csv_file):
     if not os.path.exists(csv_file):
         print(f"File {csv_file} not found.")
         return
 
-    data = []
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f, skipinitialspace=True)
-        for row in reader:
-            data.append(row)
+    df = load_csv(csv_file)
 
     # Prepare data for plotting
     tasks = ['cpu', 'mem', 'io']
@@ -20,29 +42,32 @@ def plot_part_c(csv_file):
     metrics = ['Duration', 'CPU_Usage', 'Mem_Usage', 'IO_Usage']
     titles = ['Execution Time (s)', 'CPU Usage (%)', 'Memory Usage (%)', 'IO Usage (%)']
     
-    # Store by (Prog, Task) -> {Metric: Value}
-    results = {}
-    for row in data:
-        variant = row['Program_Variant']
-        if '+' in variant:
-            prog, task = variant.split('+')
-            results[(prog, task)] = {m: float(row[m]) for m in metrics}
+    # Store by Prog -> (Task x Metric) table, missing entries as 0
+    df = df[df['Program_Variant'].str.contains('+', regex=False)]
+    parts = df['Program_Variant'].str.split('+', n=1)
+    df = df.assign(prog=parts.str[0], task=parts.str[1])
+    # Repeated variants keep their last row
+    results = {p: df[df['prog'] == p].drop_duplicates('task', keep='last')
+                  .set_index('task').reindex(tasks)[metrics].fillna(0)
+               for p in progs}
 
     # Plot Comparison 2x2 Grid
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     x = range(len(tasks))
     width = 0.35
+    x_a = [i - width/2 for i in x]
+    x_b = [i + width/2 for i in x]
     
     for idx, metric in enumerate(metrics):
         row = idx // 2
         col = idx % 2
         ax = axes[row][col]
         
-        prog_a_vals = [results.get(('Program_A', t), {}).get(metric, 0) for t in tasks]
-        prog_b_vals = [results.get(('Program_B', t), {}).get(metric, 0) for t in tasks]
+        prog_a_vals = results['Program_A'][metric].to_numpy()
+        prog_b_vals = results['Program_B'][metric].to_numpy()
         
-        rects1 = ax.bar([i - width/2 for i in x], prog_a_vals, width, label='Processes (A)')
-        rects2 = ax.bar([i + width/2 for i in x], prog_b_vals, width, label='Threads (B)')
+        ax.bar(x_a, prog_a_vals, width, label='Processes (A)')
+        ax.bar(x_b, prog_b_vals, width, label='Threads (B)')
         
         ax.set_ylabel(titles[idx])
         ax.set_title(f'Part C: {titles[idx]} Comparison')
@@ -50,8 +75,10 @@ def plot_part_c(csv_file):
         ax.set_xticklabels([t.upper() for t in tasks])
         
         # Add labels on bars
-        ax.bar_label(rects1, padding=3, fmt='%.1f')
-        ax.bar_label(rects2, padding=3, fmt='%.1f')
+        for xs, vals in ((x_a, prog_a_vals), (x_b, prog_b_vals)):
+            for xi, h, label in zip(xs, vals, np.char.mod('%.1f', vals)):
+                ax.annotate(label, (xi, h), xytext=(0, 3), textcoords='offset points',
+                            ha='center', va='bottom')
         
         ax.grid(True, axis='y', linestyle='--', alpha=0.7)
         
@@ -63,46 +90,26 @@ def plot_part_c(csv_file):
     plt.savefig('MT25091_Part_C_Plot.png')
     print("Generated MT25091_Part_C_Plot.png with 4 subplots")
 
-def plot_part_d(csv_file):
-    if not os.path.exists(csv_file):
-        print(f"File {csv_file} not found.")
-        return
-
-    data = []
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f, skipinitialspace=True)
-        for row in reader:
-            data.append(row)
-
-    # Data structure:
-    # Program_A (Processes) -> {Count: Time}
-    # Program_B (Threads) -> {Count: Time}
-    
-    # Data structure: Task -> {Prog -> {Count -> {Metric: Value}}}
+def parse_configuration(df):
+    """
+    Splits the Part D Configuration column once into prog, task and count
+    """
+    # Format: Configuration (Program_A_Scaling_TASK_COUNT), Duration, CPU_Usage...
+    # Capture only prog, task and count instead of tokenizing every field
+    parts = df['Configuration'].str.extract(r'^([^_]+_[^_]+)_.+_([^_]+)_(\d+)$')
+    valid = parts[0].notna()
+    parts = parts[valid]
+    return df[valid].assign(prog=parts[0],
+                            task=parts[1],
+                            count=parts[2].astype(int))
+
+def plot_part_d(df):
     # We want to plot 4 metrics: Duration, CPU, Mem, IO
     metrics_to_plot = ['Duration', 'CPU_Usage', 'Mem_Usage', 'IO_Usage']
-    
-    parsed_data = {} 
-    # Structure: parsed_data[task][metric][prog][count] = value
-    
-    for task in ['cpu', 'mem', 'io']:
-        parsed_data[task] = {}
-        for m in metrics_to_plot:
-            parsed_data[task][m] = {'Program_A': {}, 'Program_B': {}}
-
-    for row in data:
-        # Format: Configuration (Program_A_Scaling_TASK_COUNT), Duration, CPU_Usage...
-        config = row['Configuration']
-        
-        parts = config.split('_')
-        if len(parts) >= 5:
-            prog = f"{parts[0]}_{parts[1]}"
-            task = parts[-2]
-            count = int(parts[-1])
-            
-            if task in parsed_data:
-                for m in metrics_to_plot:
-                     parsed_data[task][m][prog][count] = float(row[m])
+
+    # Sort each (task, prog) series by worker count once; reused for every metric
+    grouped = {key: g.sort_values('count') for key, g in df.groupby(['task', 'prog'])}
+    missing = df.iloc[:0] # Series not (yet) in the CSV plot as empty lines
 
     # Create plots
     # We will create ONE big figure with rows=Tasks, cols=Metrics? 
@@ -120,16 +127,15 @@ def plot_part_d(csv_file):
         for j, metric in enumerate(metrics_to_plot):
             ax = axes[i][j]
             
-            # Get data
-            prog_a = parsed_data[task][metric]['Program_A']
-            prog_b = parsed_data[task][metric]['Program_B']
+            # Get data, sorted by worker count
+            prog_a = grouped.get((task, 'Program_A'), missing)
+            prog_b = grouped.get((task, 'Program_B'), missing)
             
-            # Sort
-            xa = sorted(prog_a.keys())
-            ya = [prog_a[k] for k in xa]
+            xa = prog_a['count'].to_numpy()
+            ya = prog_a[metric].to_numpy()
             
-            xb = sorted(prog_b.keys())
-            yb = [prog_b[k] for k in xb]
+            xb = prog_b['count'].to_numpy()
+            yb = prog_b[metric].to_numpy()
             
             ax.plot(xa, ya, marker='o', label='Proc (A)', color='blue')
             ax.plot(xb, yb, marker='x', label='Thread (B)', color='red')
@@ -145,55 +151,30 @@ def plot_part_d(csv_file):
 
     plt.suptitle('Part D: Comprehensive Scaling Analysis (Rows=Task Type, Cols=Metric)', fontsize=16)
     plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
     plt.savefig('MT25091_Part_D_Plot_1.png')
     print("Generated MT25091_Part_D_Plot_1.png with 12 subplots (3x4 grid)")
 
-def plot_memory_efficiency(csv_file):
+def plot_memory_efficiency(df):
     """
     Generates a specific plot for Memory Efficiency (Mem Usage / N)
     """
-    if not os.path.exists(csv_file):
-        print(f"File {csv_file} not found.")
-        return
-
-    data = []
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f, skipinitialspace=True)
-        # Skip potential garbage line if any, similar to plot_part_d logic
-        # But actually reader handles it if structure is clean. 
-        # Re-using simple read logic
-        for row in reader:
-            data.append(row)    
-
     plt.figure(figsize=(10, 6))
     
     # Filter for Memory Task only
     task = "mem"
     
-    proc_x = []
-    proc_y = []
-    thread_x = []
-    thread_y = []
+    mem_df = df[df['task'] == task]
 
     # Process Data
-    for row in data:
-        conf = row['Configuration']
-        if 'Program_A' in conf and f'_{task}_' in conf:
-            n = int(conf.split('_')[-1])
-            mem = float(row['Mem_Usage'])
-            proc_x.append(n)
-            proc_y.append(mem / n) # Per Worker
-    
+    a = mem_df[mem_df['prog'] == 'Program_A'].sort_values('count')
+    proc_x = a['count'].to_numpy()
+    proc_y = a['Mem_Usage'].to_numpy() / proc_x # Per Worker
+
     # Thread Data
-    for row in data:
-        conf = row['Configuration']
-        if 'Program_B' in conf and f'_{task}_' in conf:
-            n = int(conf.split('_')[-1])
-            mem = float(row['Mem_Usage'])
-            thread_x.append(n)
-            thread_y.append(mem / n) # Per Worker
-            
+    b = mem_df[mem_df['prog'] == 'Program_B'].sort_values('count')
+    thread_x = b['count'].to_numpy()
+    thread_y = b['Mem_Usage'].to_numpy() / thread_x # Per Worker
+
     plt.plot(proc_x, proc_y, marker='o', label='Process (A)', linestyle='-', color='blue')
     plt.plot(thread_x, thread_y, marker='x', label='Thread (B)', linestyle='--', color='red')
     
@@ -203,13 +184,17 @@ def plot_memory_efficiency(csv_file):
     plt.legend()
     plt.grid(True)
     
-    plt.legend()
-    plt.grid(True)
-    
     plt.savefig('MT25091_Part_D_Plot_2.png')
     print("Generated MT25091_Part_D_Plot_2.png")
 
 if __name__ == "__main__":
     plot_part_c("MT25091_Part_C_CSV.csv")
-    plot_part_d("MT25091_Part_D_CSV.csv")
-    plot_memory_efficiency("MT25091_Part_D_CSV.csv")
+
+    # Part D data is parsed once and shared by both Part D plots
+    csv_file_d = "MT25091_Part_D_CSV.csv"
+    if not os.path.exists(csv_file_d):
+        print(f"File {csv_file_d} not found.")
+    else:
+        df_d = parse_configuration(load_csv(csv_file_d))
+        plot_part_d(df_d)
+        plot_memory_efficiency(df_d)